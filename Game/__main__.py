@@ -1,7 +1,31 @@
+import argparse
+
 from game import Game
+from controller import PathController
+from mosaic import run_mosaic
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(prog="game")
+    parser.add_argument("--record", metavar="DIR", help="capture every rendered frame into DIR")
+    parser.add_argument("--record-format", choices=["png", "npz"], default="png")
+    parser.add_argument("--record-every", type=int, default=1, metavar="N", help="keep one frame out of N")
+    parser.add_argument("--bot", action="store_true", help="let the path-following AI play")
+    parser.add_argument("--levels", type=int, default=1, metavar="N", help="levels to clear to win, faster each level")
+    parser.add_argument("--mosaic", type=int, metavar="N", help="watch N headless bot games in one window")
+    args = parser.parse_args()
+
+    if args.record_every < 1:
+        parser.error("--record-every must be at least 1")
+
+    if args.mosaic:
+        run_mosaic(args.mosaic)
+        return
+
+    game = Game(max_level=args.levels)
+    if args.bot:
+        game.controller = PathController()
+    if args.record:
+        game.start_recording(args.record, args.record_format, capture_every=args.record_every)
     game.run()
 
 if __name__ == "__main__": main()
@@ -0,0 +1,20 @@
+import math
+
+
+def swept_distance(a_start, a_end, b_start, b_end):
+    """Closest distance between two entities moving in straight lines during one step.
+
+    Both move from their start to their end position over the same interval,
+    so entities that cross each other between frames still register as
+    touching, whatever their speed.
+    """
+    # Position and velocity of b relative to a
+    rx, ry = b_start.x - a_start.x, b_start.y - a_start.y
+    vx = (b_end.x - b_start.x) - (a_end.x - a_start.x)
+    vy = (b_end.y - b_start.y) - (a_end.y - a_start.y)
+
+    speed_squared = vx * vx + vy * vy
+    t = 0.0
+    if speed_squared > 0:
+        t = min(1.0, max(0.0, -(rx * vx + ry * vy) / speed_squared))
+    return math.hypot(rx + vx * t, ry + vy * t)
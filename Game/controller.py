@@ -0,0 +1,257 @@
+import heapq
+from collections import deque
+
+from ghost import GhostState
+from player import LEFT, RIGHT, UP, DOWN
+
+# Grid step -> direction applied to Player.next_direction
+STEPS = {(1, 0): RIGHT, (-1, 0): LEFT, (0, 1): DOWN, (0, -1): UP}
+
+
+class PathController:
+    """Bot that follows a cached A* path to the best safe dot.
+
+    Ghosts are compared by arrival time: a tile is only walked through if the
+    player is clear of it `margin` tiles before any dangerous ghost can get
+    there, and dots are ranked by how soon they can be reached, pushed back
+    when a ghost could arrive right after the player. The path is only
+    recomputed when it can have become wrong: the target dot was eaten (or
+    the maze was reset), a dangerous ghost came closer to the remaining path
+    while within the danger radius of it, a ghost turned FRIGHTENED, or the
+    player left the path. Every other frame just steers along the cached path.
+    """
+
+    def __init__(self, danger_radius=4, ghost_weight=8.0, margin=1.0, safe_slack=6.0, slack_weight=4.0):
+        self.danger_radius = danger_radius  # tiles around a ghost considered unsafe
+        self.ghost_weight = ghost_weight    # extra path cost per tile of ghost proximity
+        self.margin = margin                # tiles the player must stay ahead of a ghost by
+        self.safe_slack = safe_slack        # lead over the ghosts at a dot that needs no penalty
+        self.slack_weight = slack_weight    # extra score per tile of lead short of safe_slack
+
+        self.path = deque()  # remaining tiles (x, y), next tile first
+        self.target = None
+
+        # Counters
+        self.replans = 0
+        self.cached_steps = 0
+
+        self._dots_version = None
+        self._ghosts = {}    # dangerous ghost index -> tile, as of the last check
+        self._threats = {}   # dangerous ghost index -> distance to the path, within danger_radius
+        self._frightened = frozenset()
+
+    def reset(self):
+        self.path.clear()
+        self.target = None
+        self._dots_version = None
+        self._ghosts, self._threats = {}, {}
+
+    def update(self, game):
+        maze, player = game.maze, game.player
+        tile = maze.convert_to_grid(*player.position)
+
+        ghosts, dangerous, frightened = {}, [], set()
+        for index, ghost in enumerate(game.ghosts):
+            if ghost.state == GhostState.FRIGHTENED:
+                frightened.add(index)
+            elif ghost.state != GhostState.EATEN:
+                ghosts[index] = maze.convert_to_grid(*ghost.position)
+                dangerous.append(ghost)
+
+        if self._needs_replan(maze, tile, ghosts, frightened):
+            self._plan(maze, player, tile, dangerous)
+            self._threats = self._path_threats(tile, ghosts)
+            self.replans += 1
+        else:
+            self.cached_steps += 1
+        self._ghosts, self._frightened = ghosts, frozenset(frightened)
+
+        # Steer towards the next tile on the path
+        while self.path and self.path[0] == tile:
+            self.path.popleft()
+        if self.path:
+            next_x, next_y = self.path[0]
+            direction = STEPS.get((next_x - tile[0], next_y - tile[1]))
+            if direction is not None and direction != player.direction:
+                player.next_direction = direction
+
+    def _needs_replan(self, maze, tile, ghosts, frightened):
+        # Nothing left to follow (target reached, or the last plan found no safe path)
+        if not self.path:
+            return True
+
+        if maze.dots_version != self._dots_version:
+            self._dots_version = maze.dots_version
+            # Only the target matters: dots along the way are eaten by following the path
+            if maze.last_eaten is None or maze.last_eaten == self.target:
+                return True
+
+        if frightened - self._frightened:
+            return True
+
+        # Ghosts only move a tile every few frames: recheck the path when one did
+        if ghosts != self._ghosts:
+            threats = self._path_threats(tile, ghosts)
+            closer = any(distance < self._threats.get(index, self.danger_radius + 1)
+                         for index, distance in threats.items())
+            self._threats = threats
+            if closer:
+                return True
+
+        # Knocked off the path (e.g. blocked turn): the next tile must stay adjacent
+        next_x, next_y = self.path[0]
+        return abs(next_x - tile[0]) + abs(next_y - tile[1]) > 1
+
+    def _next_center(self, maze, entity):
+        """The tile where entity can next change direction, and how far off its center is, in tiles.
+
+        Turns only happen at tile centers: once past the center of its tile,
+        an entity is committed to the tile ahead.
+        """
+        tile = maze.convert_to_grid(*entity.position)
+        center_x, center_y = maze.get_tile_center(*entity.position)
+        direction = entity.direction
+        past = (entity.position.x - center_x) * direction.x + (entity.position.y - center_y) * direction.y
+        if past <= 0:
+            return tile, -past / maze.tile_size
+        ahead = (tile[0] + int(direction.x), tile[1] + int(direction.y))
+        if maze.walls[ahead[1]][ahead[0]]:
+            return tile, 0
+        return ahead, (maze.tile_size - past) / maze.tile_size
+
+    def _path_threats(self, tile, ghosts):
+        """Manhattan distance from each ghost to the remaining path, for ghosts within danger_radius."""
+        threats = {}
+        for index, (ghost_x, ghost_y) in ghosts.items():
+            distance = abs(ghost_x - tile[0]) + abs(ghost_y - tile[1])
+            for x, y in self.path:
+                if distance <= 0: break
+                distance = min(distance, abs(ghost_x - x) + abs(ghost_y - y))
+            if distance <= self.danger_radius:
+                threats[index] = distance
+        return threats
+
+    def _ghost_times(self, maze, player, ghosts):
+        """Earliest time any dangerous ghost can reach each tile, in tiles of player movement.
+
+        Ghosts never turn back on themselves, so each one is walked forward
+        from its heading: the tiles behind it are only reached the long way.
+        """
+        walls = maze.walls
+        never = float(maze.width * maze.height)
+        times = [[never] * maze.width for _ in range(maze.height)]
+        for ghost in ghosts:
+            (x, y), lead = self._next_center(maze, ghost)
+            pace = player.speed / ghost.speed  # player tiles per ghost tile
+            heading = (int(ghost.direction.x), int(ghost.direction.y))
+            times[y][x] = min(times[y][x], lead * pace)
+            seen = {(x, y, heading)}
+            frontier = deque([(x, y, heading, lead * pace)])
+            while frontier:
+                x, y, heading, time = frontier.popleft()
+                time += pace
+                for dx, dy in STEPS:
+                    if heading == (-dx, -dy): continue
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < maze.width and 0 <= ny < maze.height) or walls[ny][nx]: continue
+                    if (nx, ny, (dx, dy)) in seen: continue
+                    seen.add((nx, ny, (dx, dy)))
+                    if time < times[ny][nx]: times[ny][nx] = time
+                    frontier.append((nx, ny, (dx, dy), time))
+        return times
+
+    def _plan(self, maze, player, tile, ghosts):
+        self._dots_version = maze.dots_version
+        self.path.clear()
+        self.target = None
+
+        times = self._ghost_times(maze, player, ghosts)
+        start, lead = self._next_center(maze, player)
+        if start != tile: self.path.append(start)
+
+        # Rank the dots the player can reach first by arrival time, plus a
+        # penalty when a ghost could arrive shortly after
+        came_from, arrival = self._safe_tiles(maze, start, lead, times)
+        grid = maze.grid
+        best = None
+        for (x, y), steps in arrival.items():
+            if grid[y, x] not in (2, 3) or (x, y) == start: continue
+            score = steps + self.slack_weight * max(0.0, self.safe_slack - (times[y][x] - steps))
+            if best is None or score < best[0]:
+                best = score, (x, y)
+
+        if best is not None:
+            target = best[1]
+            # A* prefers tiles further from the ghosts; the BFS route is safe too
+            path = self._astar(maze, start, target, times, lead) or self._route(came_from, start, target)
+            self.target = target
+            self.path.extend(path)
+            return
+
+        # No dot is safely reachable yet: keep running from the ghosts
+        self._flee(maze, start, lead, times)
+
+    def _astar(self, maze, start, goal, times, steps=0):
+        walls = maze.walls
+        goal_x, goal_y = goal
+        open_heap = [(0, 0, steps, start)]
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+
+        while open_heap:
+            _, cost, steps, current = heapq.heappop(open_heap)
+            if current == goal:
+                path = []
+                while current != start:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+            if cost > cost_so_far[current]: continue
+
+            x, y = current
+            for dx, dy in STEPS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < maze.width and 0 <= ny < maze.height) or walls[ny][nx]: continue
+                # Only step where the player is clear of the tile before any ghost can get there
+                if steps + 1 + self.margin >= times[ny][nx]: continue
+                new_cost = cost + 1 + self.ghost_weight * max(0, self.danger_radius + 1 - times[ny][nx])
+                if new_cost < cost_so_far.get((nx, ny), float("inf")):
+                    cost_so_far[(nx, ny)] = new_cost
+                    came_from[(nx, ny)] = current
+                    heuristic = abs(goal_x - nx) + abs(goal_y - ny)
+                    heapq.heappush(open_heap, (new_cost + heuristic, new_cost, steps + 1, (nx, ny)))
+        return None
+
+    def _safe_tiles(self, maze, start, steps, times):
+        """Tiles the player can reach from start before any dangerous ghost, with their arrival step."""
+        walls = maze.walls
+        came_from = {start: None}
+        arrival = {start: steps}
+        frontier = deque([start])
+        while frontier:
+            x, y = current = frontier.popleft()
+            steps = arrival[current] + 1
+            for dx, dy in STEPS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < maze.width and 0 <= ny < maze.height) or walls[ny][nx]: continue
+                if (nx, ny) in arrival or steps + self.margin >= times[ny][nx]: continue
+                came_from[(nx, ny)] = current
+                arrival[(nx, ny)] = steps
+                frontier.append((nx, ny))
+        return came_from, arrival
+
+    def _route(self, came_from, start, goal):
+        path = []
+        current = goal
+        while current != start:
+            path.append(current)
+            current = came_from[current]
+        path.reverse()
+        return path
+
+    def _flee(self, maze, start, steps, times):
+        came_from, arrival = self._safe_tiles(maze, start, steps, times)
+        best = max(arrival, key=arrival.get)  # the run that stays ahead of the ghosts longest
+        self.path.extend(self._route(came_from, start, best))
+        self.target = best
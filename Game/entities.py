@@ -0,0 +1,58 @@
+from vector import Vector2
+
+
+class EntityPool:
+    """Preallocated parallel lists holding the per-frame state of every entity.
+
+    Ghost and Player objects only keep a slot index into the pool; their
+    position, direction, speed and state are read and written here
+    in place, so a simulation step does not create new objects.
+    """
+
+    VECTOR_FIELDS = ("position", "direction", "next_direction", "last_position")
+    SCALAR_FIELDS = ("speed", "state")
+
+    __slots__ = VECTOR_FIELDS + SCALAR_FIELDS + ("capacity", "size")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.size = 0
+        for name in self.VECTOR_FIELDS:
+            setattr(self, name, [Vector2(0, 0) for _ in range(capacity)])
+        for name in self.SCALAR_FIELDS:
+            setattr(self, name, [0] * capacity)
+
+    def allocate(self):
+        if self.size >= self.capacity:
+            raise IndexError(f"EntityPool is full ({self.capacity} slots)")
+        slot = self.size
+        self.size += 1
+        return slot
+
+
+class PoolVector:
+    """Vector attribute stored in the owner's pool slot; assignment copies in place."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        return getattr(obj._pool, self.name)[obj._slot]
+
+    def __set__(self, obj, value):
+        getattr(obj._pool, self.name)[obj._slot].update(value)
+
+
+class PoolField:
+    """Scalar attribute stored in the owner's pool slot."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        return getattr(obj._pool, self.name)[obj._slot]
+
+    def __set__(self, obj, value):
+        getattr(obj._pool, self.name)[obj._slot] = value
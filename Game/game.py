@@ -1,13 +1,20 @@
-import pygame
 import numpy as np
 
 from maze import Maze
 from player import Player
 from ghost import Ghost, GhostType
+from entities import EntityPool
+from scheduler import TickScheduler
+from collision import swept_distance
+
+# pygame is imported lazily by the rendering code, so headless simulations
+# (workers, sweeps, inference) never load SDL
 
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color, text_color):
+        import pygame
+        
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
@@ -16,6 +23,8 @@ class Button:
         self.is_hovered = False
     
     def draw(self, screen, font):
+        import pygame
+        
         current_color = self.hover_color if self.is_hovered else self.color
         
         # Draw the button rectangle
@@ -35,18 +44,33 @@ class Button:
         return self.rect.collidepoint(mouse_pos)
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, max_level=1, ghost_params=None):
+        self.headless = headless
+        self.ghost_params = ghost_params  # overrides for Ghost.TUNABLE constants
         self.maze = Maze()
+        self.fps = 50
+        
+        # Clearing the maze moves on to the next level until max_level is won
+        self.max_level = max_level
+        self.level_speedup = 0.1  # extra speed per level, relative to level 1
+        self.max_speed_multiplier = 1.5
+        self.recorder = None
+        self.controller = None  # optional AI driving player.next_direction
+        
+        # Initialize game elements
+        self.initialize_game()
+        
+        if not headless: self.init_display()
+    
+    def init_display(self):
+        import pygame
+        
+        pygame.init()
         self.screen = pygame.display.set_mode(
             (self.maze.screen_width, self.maze.screen_height)
         )
         pygame.display.set_caption("Pac-Man")
         self.clock = pygame.time.Clock()
-        self.fps = 50
-        
-        # Initialize game elements
-        self.initialize_game()
         
         # Font setup
         self.font = pygame.font.Font(None, 36)
@@ -61,11 +85,16 @@ class Game:
             "Play again", (200, 0, 0), (250, 0, 0), (255, 255, 255)
         )
     
-    def initialize_game(self):
+    def initialize_game(self, level=1, score=0):
+        # One pool slot for the player and one per ghost
+        self.entities = EntityPool(5)
+        # Every timed event (ghost modes, frightened expiry, animations) runs on this clock
+        self.scheduler = TickScheduler()
+        
         # Setup player
         player_start_x = self.maze.tile_size * 9 + self.maze.tile_size // 2
         player_start_y = self.maze.tile_size * 15 + self.maze.tile_size // 2
-        self.player = Player(player_start_x, player_start_y)
+        self.player = Player(player_start_x, player_start_y, self.entities, self.scheduler)
         
         # Setup ghosts with their new ghost types
         ghost_start_positions = [
@@ -93,16 +122,28 @@ class Game:
         
         self.ghosts = []
         for x, y, color, ghost_type in ghost_start_positions:
-            self.ghosts.append(Ghost(x, y, color, ghost_type))
+            self.ghosts.append(Ghost(x, y, color, ghost_type, self.entities, self.scheduler, self.ghost_params))
         
         # Add ghosts attribute to player for Inky's targeting
         self.player.ghosts = self.ghosts
+        self.player.score = score
+        self.player.power_duration = self.ghosts[0].frightened_duration
+        
+        # Everyone speeds up on later levels
+        multiplier = self.speed_multiplier(level)
+        self.player.speed *= multiplier
+        for ghost in self.ghosts:
+            ghost.original_speed *= multiplier
+            ghost.speed = ghost.original_speed
         
         # Game state
         self.running = True
         self.game_over = False
         self.win = False
-        self.level = 1
+        self.level = level
+
+    def speed_multiplier(self, level):
+        return min(1 + self.level_speedup * (level - 1), self.max_speed_multiplier)
 
     def reset_game(self):
         # Reset maze (recreate dots/pellets)
@@ -110,6 +151,11 @@ class Game:
         
         # Reset player and ghosts
         self.initialize_game()
+    
+    def next_level(self):
+        # Fresh maze and starting positions, score carries over
+        self.maze.reset()
+        self.initialize_game(self.level + 1, self.player.score)
  
     def get_grid_player(self):
         position = np.zeros(self.maze.grid.shape)
@@ -138,9 +184,12 @@ class Game:
         return positions, next_positions
 
     def check_collisions(self):
+        player = self.player
         for ghost in self.ghosts:
-            distance = (ghost.position - self.player.position).length()
-            if distance < (ghost.radius + self.player.radius):
+            # Swept test: catches ghosts and Pac-Man passing through each other within a step
+            distance = swept_distance(player.last_position, player.position,
+                                      ghost.last_position, ghost.position)
+            if distance < (ghost.radius + player.radius):
                 if ghost.state == ghost.state.FRIGHTENED:
                     ghost.enter_eaten_mode()
                     # Score for eating ghost increases with each ghost eaten
@@ -153,10 +202,15 @@ class Game:
         
         # Check win condition
         if self.maze.count_dots() == 0:
-            self.win = True
-            self.game_over = True
+            if self.level < self.max_level:
+                self.next_level()
+            else:
+                self.win = True
+                self.game_over = True
     
     def handle_events(self):
+        import pygame
+        
         mouse_pos = pygame.mouse.get_pos()
         
         for event in pygame.event.get():
@@ -178,6 +232,10 @@ class Game:
     def update(self):
         if self.game_over: return
         
+        self.scheduler.advance()
+        
+        if self.controller: self.controller.update(self)
+        
         power_pellet = self.player.update(self.maze)
         if power_pellet:
             for ghost in self.ghosts: ghost.enter_frightened_mode()
@@ -186,15 +244,29 @@ class Game:
         
         self.check_collisions()
     
-    def draw(self):
-        self.screen.fill((0, 0, 0))
+    def simulate(self, max_steps):
+        """Run headless updates until the game ends or max_steps; returns the steps played."""
+        steps = 0
+        while not self.game_over and steps < max_steps:
+            self.update()
+            steps += 1
+        return steps
+    
+    def render(self, surface):
+        # Playfield only (no HUD), so other views can draw a game onto any surface
+        surface.fill((0, 0, 0))
 
-        self.maze.draw(self.screen)
+        self.maze.draw(surface)
         
         for ghost in self.ghosts:
-            ghost.draw(self.screen)
+            ghost.draw(surface)
         
-        self.player.draw(self.screen)
+        self.player.draw(surface)
+    
+    def draw(self):
+        import pygame
+        
+        self.render(self.screen)
         
         # Draw score
         score_text = self.font.render(f"Score: {self.player.score}", True, (255, 255, 255))
@@ -219,13 +291,30 @@ class Game:
             # Draw restart button
             self.restart_button.draw(self.screen, self.button_font)
         
+        if self.recorder: self.recorder.capture(self.screen)
+        
         pygame.display.flip()
     
+    def start_recording(self, output_dir, fmt="png", **kwargs):
+        from recorder import FrameRecorder
+        
+        self.stop_recording()
+        self.recorder = FrameRecorder(output_dir, fmt, **kwargs)
+        self.recorder.start()
+    
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.stop()
+            self.recorder = None
+    
     def run(self):
+        import pygame
+        
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
             self.clock.tick(self.fps)
         
+        self.stop_recording()
         pygame.quit()
\ No newline at end of file
@@ -1,8 +1,10 @@
-import pygame
-from pygame.math import Vector2
 import random
 from enum import Enum
 
+from entities import EntityPool, PoolField, PoolVector
+from scheduler import TickScheduler
+from vector import Vector2
+
 class GhostState(Enum):
     SCATTER = 0
     CHASE = 1
@@ -15,11 +17,44 @@ class GhostType(Enum):
     INKY = 2    # Cyan - Bashful - Unpredictable
     CLYDE = 3   # Orange - Pokey - Feigned ignorance
 
+# Shared direction constants, never mutated
+DIRECTIONS = (Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1))
+STOP = Vector2(0, 0)
+
 class Ghost:
-    def __init__(self, x, y, color, ghost_type):
-        self.position = Vector2(x, y)
-        self.direction = Vector2(0, 0)
-        self.next_direction = Vector2(0, 0)
+    __slots__ = ("_pool", "_slot", "_possible", "_target", "scheduler",
+                 "_mode_event", "_mode_remaining", "_frightened_event", "_override_event",
+                 "_stuck_anchor",
+                 "original_speed", "radius", "color", "ghost_type",
+                 "frightened_color", "eaten_color", "frightened_duration",
+                 "scatter_duration", "chase_duration",
+                 "home_corner", "spawn_point", "eaten_speed_multiplier",
+                 "mode_durations", "mode_index", "stuck_threshold", "override_direction",
+                 "override_duration", "escape_pending", "pinky_lead", "clyde_shyness")
+
+    # Behaviour constants that can be overridden through the params argument
+    TUNABLE = ("scatter_duration", "chase_duration", "frightened_duration",
+               "eaten_speed_multiplier", "pinky_lead", "clyde_shyness")
+
+    # Hot state lives in the EntityPool, these are views on this ghost's slot
+    position = PoolVector()
+    direction = PoolVector()
+    next_direction = PoolVector()
+    last_position = PoolVector()
+    speed = PoolField()
+    state = PoolField()
+
+    def __init__(self, x, y, color, ghost_type, pool=None, scheduler=None, params=None):
+        self._pool = pool if pool is not None else EntityPool(1)
+        self._slot = self._pool.allocate()
+        # Owner advances the scheduler once per tick (Game does it in update)
+        self.scheduler = scheduler if scheduler is not None else TickScheduler()
+        self._possible = []  # scratch list reused by get_possible_directions
+        self._target = Vector2(0, 0)  # scratch vector for chase targets
+
+        self.position = (x, y)
+        self.direction = (0, 0)
+        self.next_direction = (0, 0)
         self.speed = 2
         self.original_speed = 2
         self.radius = 13
@@ -28,27 +63,42 @@ class Ghost:
         self.state = GhostState.SCATTER
         self.frightened_color = (0, 0, 255)  # blue
         self.eaten_color = (255, 255, 255)  # white
-        self.frightened_timer = 0
         self.frightened_duration = 500  # duration update cycles
-        self.scatter_timer = 0
         self.scatter_duration = 350  # ~7 seconds at 50fps
         self.chase_duration = 1000   # ~20 seconds at 50fps
         self.home_corner = self._get_home_corner(ghost_type)
         self.spawn_point = Vector2(x, y)
         self.eaten_speed_multiplier = 2.0
+        self.pinky_lead = 4  # tiles ahead of the player Pinky aims for
+        self.clyde_shyness = 8  # tiles from the player under which Clyde retreats
+        
+        for name, value in (params or {}).items():
+            if name not in self.TUNABLE:
+                raise ValueError(f"Unknown ghost parameter: {name!r} (expected one of {self.TUNABLE})")
+            setattr(self, name, value)
         
-        # For mode switching
-        self.mode_timer = 0
+        # For mode switching, paused while frightened or eaten
         self.mode_durations = [(self.scatter_duration, GhostState.SCATTER), 
                               (self.chase_duration, GhostState.CHASE)]
         self.mode_index = 0
+        self._mode_remaining = None
+        self._mode_event = self.scheduler.schedule(self.scatter_duration, self._switch_mode)
+        self._frightened_event = None
 
          # Add variables to detect stuck ghosts
-        self.last_position = Vector2(x, y)
-        self.stuck_timer = 0
+        self.last_position = (x, y)
         self.stuck_threshold = 10  # If not moved for 10 frames, ghost is considered stuck
         self.override_direction = None
-        self.override_timer = 0
+        self.override_duration = 10  # frames the escape direction is forced
+        self._override_event = None
+        self._stuck_anchor = Vector2(x, y)
+        self.escape_pending = False
+        self.scheduler.schedule(self.stuck_threshold, self._check_stuck)
+    
+    @property
+    def frightened_timer(self):
+        """Ticks left before frightened mode ends."""
+        return self.scheduler.remaining(self._frightened_event)
         
     def _get_home_corner(self, ghost_type):
         # Define scatter corners for each ghost
@@ -63,8 +113,10 @@ class Ghost:
         return Vector2(0, 0)  # Default
 
     def get_possible_directions(self, maze):
-        possible = []
-        for direction in [Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1)]:
+        # Reuses the same list every call: callers must not keep a reference to it
+        possible = self._possible
+        possible.clear()
+        for direction in DIRECTIONS:
             if self.can_move_in_direction(direction, maze): 
                 possible.append(direction)
         return possible
@@ -73,21 +125,19 @@ class Ghost:
         possible_directions = self.get_possible_directions(maze)
         
         # If we have an override direction from being stuck, use it
-        if self.override_direction and self.override_direction in possible_directions:
-            if self.override_timer > 0:
-                self.override_timer -= 1
-                return self.override_direction
-            else:
-                self.override_direction = None
+        if self.override_direction is not None and self.override_direction in possible_directions:
+            return self.override_direction
         
         # Remove reverse direction unless it's the only option
-        if len(possible_directions) > 1 and self.direction != Vector2(0, 0):
-            opposite = self.direction * -1
-            if opposite in possible_directions:
-                possible_directions.remove(opposite)
+        if len(possible_directions) > 1 and self.direction:
+            dx, dy = self.direction
+            for direction in possible_directions:
+                if direction.x == -dx and direction.y == -dy:
+                    possible_directions.remove(direction)
+                    break
         
         if not possible_directions:
-            return Vector2(0, 0)
+            return STOP
         
         if self.state == GhostState.FRIGHTENED:
             # Random movement during frightened mode
@@ -113,10 +163,14 @@ class Ghost:
         # Find direction that minimizes distance to target
         best_dist = float('inf')
         best_dir = possible_directions[0]
+        x, y = self.position
+        target_x, target_y = target_pos
         
         for direction in possible_directions:
-            next_pos = self.position + direction * 30  # Approximating one tile distance
-            dist = (next_pos - target_pos).length_squared()  # Squared for efficiency
+            # Approximating one tile distance
+            dx = x + direction.x * 30 - target_x
+            dy = y + direction.y * 30 - target_y
+            dist = dx * dx + dy * dy  # Squared for efficiency
             if dist < best_dist:
                 best_dist = dist
                 best_dir = direction
@@ -128,11 +182,14 @@ class Ghost:
             return player.position
         
         elif self.ghost_type == GhostType.PINKY:  # Pink - ambush ahead
-            # Target 4 tiles ahead of player
-            target = player.position + player.direction * 4 * maze.tile_size
+            # Target pinky_lead (4) tiles ahead of player
+            target = self._target
+            target.update(player.direction)
+            target *= self.pinky_lead * maze.tile_size
+            target += player.position
             # Classic Pac-Man bug: when facing up, also offset left
             if player.direction.y < 0:
-                target += Vector2(-4 * maze.tile_size, 0)
+                target.x -= self.pinky_lead * maze.tile_size
             return target
         
         elif self.ghost_type == GhostType.INKY:  # Cyan - complex targeting
@@ -147,24 +204,28 @@ class Ghost:
                         break
             
             # 2 tiles ahead of player
-            pivot = player.position + player.direction * 2 * maze.tile_size
+            pivot = self._target
+            pivot.update(player.direction)
+            pivot *= 2 * maze.tile_size
+            pivot += player.position
             
             # Classic Pac-Man bug: when facing up, also offset left
             if player.direction.y < 0:
-                pivot += Vector2(-2 * maze.tile_size, 0)
+                pivot.x -= 2 * maze.tile_size
             
             if blinky_pos:
                 # Vector from Blinky to pivot point, doubled
-                offset = pivot - blinky_pos
-                return pivot + offset
+                pivot *= 2
+                pivot -= blinky_pos
+                return pivot
             else:
                 # Fallback if can't find Blinky
                 return pivot
         
         elif self.ghost_type == GhostType.CLYDE:  # Orange - shy behavior
             # Chase directly if far, scatter if close
-            distance_to_player = (self.position - player.position).length()
-            if distance_to_player > 8 * maze.tile_size:
+            distance_to_player = self.position.distance_to(player.position)
+            if distance_to_player > self.clyde_shyness * maze.tile_size:
                 return player.position
             else:
                 return self.home_corner
@@ -173,102 +234,108 @@ class Ghost:
         return player.position
     
     def can_move_in_direction(self, direction, maze):
-        next_tile_pos = self.position + direction * maze.tile_size
-        return not maze.is_wall(next_tile_pos.x, next_tile_pos.y)
-    
-    def is_at_center(self, maze):
-        center_x, center_y = maze.get_tile_center(self.position.x, self.position.y)
-        return (abs(self.position.x - center_x) < self.speed and 
-                abs(self.position.y - center_y) < self.speed)
+        position = self.position
+        return not maze.is_wall(position.x + direction.x * maze.tile_size,
+                                position.y + direction.y * maze.tile_size)
     
     def enter_frightened_mode(self):
         if self.state != GhostState.EATEN:
+            self._pause_mode()
             self.state = GhostState.FRIGHTENED
-            self.frightened_timer = self.frightened_duration
-            self.direction = self.direction * -1  # Reverse direction
+            self.scheduler.cancel(self._frightened_event)
+            self._frightened_event = self.scheduler.schedule(self.frightened_duration, self.exit_frightened_mode)
+            self.direction *= -1  # Reverse direction
             self.speed = self.original_speed * 0.5  # Slow down
     
     def exit_frightened_mode(self):
         if self.state == GhostState.FRIGHTENED:
-            # Return to previous mode based on timer
-            self.update_mode()
+            self.scheduler.cancel(self._frightened_event)
             self.state = GhostState.CHASE
             self.speed = self.original_speed
+            self._resume_mode()
     
-    def update_mode(self):
-        # Check if we should switch between scatter and chase
-        current_duration, current_state = self.mode_durations[self.mode_index]
-        self.mode_timer += 1
-        
-        if self.mode_timer >= current_duration:
-            self.mode_timer = 0
-            self.mode_index = (self.mode_index + 1) % len(self.mode_durations)
-            _, new_state = self.mode_durations[self.mode_index]
-            if self.state != GhostState.FRIGHTENED and self.state != GhostState.EATEN:
-                self.state = new_state
-                # Reverse direction on mode switch
-                self.direction = self.direction * -1
+    def _switch_mode(self):
+        # Scheduled at the end of each scatter/chase phase
+        self.mode_index = (self.mode_index + 1) % len(self.mode_durations)
+        duration, new_state = self.mode_durations[self.mode_index]
+        self._mode_event = self.scheduler.schedule(duration, self._switch_mode)
+        self.state = new_state
+        # Reverse direction on mode switch
+        self.direction *= -1
+    
+    def _pause_mode(self):
+        if self._mode_remaining is None:
+            self._mode_remaining = self.scheduler.remaining(self._mode_event)
+            self.scheduler.cancel(self._mode_event)
+    
+    def _resume_mode(self):
+        if self._mode_remaining is not None:
+            self._mode_event = self.scheduler.schedule(self._mode_remaining, self._switch_mode)
+            self._mode_remaining = None
     
     def enter_eaten_mode(self):
+        self.scheduler.cancel(self._frightened_event)
+        self._pause_mode()
         self.state = GhostState.EATEN
         self.speed = self.original_speed * self.eaten_speed_multiplier
     
     def reached_home(self):
         return (self.state == GhostState.EATEN and
-                (self.position - self.spawn_point).length() < self.speed * 2)
+                self.position.distance_to(self.spawn_point) < self.speed * 2)
     
     def revive(self):
         self.state = GhostState.SCATTER
         self.speed = self.original_speed
-        self.position = Vector2(self.spawn_point)
+        self.position = self.spawn_point
+        self.last_position = self.spawn_point  # teleport, not a swept move
+        self._resume_mode()
+    
+    def _check_stuck(self):
+        # Runs every stuck_threshold ticks: barely moving since the last check means stuck
+        self.scheduler.schedule(self.stuck_threshold, self._check_stuck)
+        if self.position.distance_to(self._stuck_anchor) < 0.5 * self.stuck_threshold:
+            self.escape_pending = True
+        self._stuck_anchor.update(self.position)
+    
+    def _clear_override(self):
+        self.override_direction = None
     
     def update(self, maze, player):
-        # Handle mode switching for scatter/chase
-        if self.state != GhostState.FRIGHTENED and self.state != GhostState.EATEN:
-            self.update_mode()
-        
-        # Update frightened timer
-        if self.state == GhostState.FRIGHTENED:
-            self.frightened_timer -= 1
-            if self.frightened_timer <= 0:
-                self.exit_frightened_mode()
-        
         # Check if eaten ghost has reached home
         if self.reached_home():
             self.revive()
         
-        # Check for stuck ghosts (haven't moved significantly)
-        distance_moved = (self.position - self.last_position).length()
-        if distance_moved < 0.5:  # If barely moved
-            self.stuck_timer += 1
-            if self.stuck_timer >= self.stuck_threshold:
-                # Ghost is stuck, choose a random direction to escape
-                possible = self.get_possible_directions(maze)
-                if possible:
-                    self.override_direction = random.choice(possible)
-                    self.override_timer = 10  # Use this direction for next 10 frames
-                    self.stuck_timer = 0
-        else:
-            self.stuck_timer = 0  # Reset stuck timer if moving
+        if self.escape_pending:
+            # Ghost is stuck, choose a random direction to escape
+            self.escape_pending = False
+            possible = self.get_possible_directions(maze)
+            if possible:
+                self.override_direction = random.choice(possible)
+                self.scheduler.cancel(self._override_event)
+                self._override_event = self.scheduler.schedule(self.override_duration, self._clear_override)
         
-        # Save current position for next frame's comparison
-        self.last_position = Vector2(self.position)
+        # Remember where this frame's movement starts
+        self.last_position = self.position
         
-        # Movement logic
-        if self.is_at_center(maze):
+        # Movement logic: a new direction is chosen at every tile center this
+        # move crosses, so fast ghosts still turn where the maze does
+        position, direction = self.position, self.direction
+        remaining = self.speed
+        ahead = maze.distance_to_center(position.x, position.y, direction.x, direction.y)
+        while ahead < remaining or ahead == 0:
+            position.update(position.x + direction.x * ahead, position.y + direction.y * ahead)
+            remaining -= ahead
             new_direction = self.choose_direction(maze, player)
-            if new_direction != Vector2(0, 0):
+            if new_direction:
                 self.direction = new_direction
-                # Snap to grid when turning to prevent getting stuck on walls
-                center_x, center_y = maze.get_tile_center(self.position.x, self.position.y)
-                self.position.x = center_x
-                self.position.y = center_y
+            if not direction or not self.can_move_in_direction(direction, maze): break
+            ahead = maze.tile_size
         
-        if self.direction:
-            new_pos = self.position + self.direction * self.speed
-            if not maze.is_wall(new_pos.x, new_pos.y):
-                self.position = new_pos
-            else:
+        if remaining and direction:
+            new_x, new_y, blocked = maze.sweep(position.x, position.y,
+                                               direction.x * remaining, direction.y * remaining)
+            position.update(new_x, new_y)
+            if blocked:
                 # Try to unstick from wall if needed
                 self.unstick_from_wall(maze, player)
                 
@@ -280,7 +347,7 @@ class Ghost:
         self.position.y = center_y
         
         # Force a random direction if we're in a tight spot
-        if self.stuck_timer > 5:
+        if self.override_direction is not None:
             possible = self.get_possible_directions(maze)
             if possible:
                 self.direction = random.choice(possible)
@@ -288,6 +355,8 @@ class Ghost:
             self.direction = self.choose_direction(maze, player)
 
     def draw(self, screen):
+        import pygame
+        
         current_color = self.color
         if self.state == GhostState.FRIGHTENED:
             # Blinking when frightened mode is ending
@@ -0,0 +1,182 @@
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from player import LEFT, RIGHT, UP, DOWN
+
+# Policy output index -> direction applied to Player.next_direction
+ACTIONS = (UP, DOWN, LEFT, RIGHT)
+
+
+def observe(game):
+    """Flatten a game into the float32 observation vector fed to the policy."""
+    grid = game.maze.grid
+    player, _ = game.get_grid_player()
+    ghosts, _ = game.get_grid_ghosts()
+    channels = (grid == 1, grid == 2, grid == 3, player, ghosts)
+    return np.concatenate([channel.ravel() for channel in channels]).astype(np.float32)
+
+
+class MLPPolicy:
+    """Small two-layer NumPy network mapping observations to action logits."""
+
+    def __init__(self, input_size, hidden_size=64, seed=0):
+        rng = np.random.default_rng(seed)
+        self.w1 = rng.normal(0, 1 / np.sqrt(input_size), (input_size, hidden_size)).astype(np.float32)
+        self.b1 = np.zeros(hidden_size, dtype=np.float32)
+        self.w2 = rng.normal(0, 1 / np.sqrt(hidden_size), (hidden_size, len(ACTIONS))).astype(np.float32)
+        self.b2 = np.zeros(len(ACTIONS), dtype=np.float32)
+
+    def __call__(self, observations):
+        hidden = np.maximum(observations @ self.w1 + self.b1, 0)
+        return hidden @ self.w2 + self.b2
+
+
+class InferenceStats:
+    def __init__(self, window=1000):
+        self.requests = 0
+        self.batches = 0
+        self.batch_sizes = Counter()  # batch size -> number of batches
+        self.latencies = deque(maxlen=window)  # seconds spent queued, most recent requests
+        self.max_latency = 0.0
+
+    def record(self, batch_size, latencies):
+        self.requests += batch_size
+        self.batches += 1
+        self.batch_sizes[batch_size] += 1
+        self.latencies.extend(latencies)
+        self.max_latency = max(self.max_latency, max(latencies))
+
+    def summary(self):
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "latency_ms_p50": float(np.percentile(latencies, 50)),
+            "latency_ms_p95": float(np.percentile(latencies, 95)),
+            "latency_ms_max": self.max_latency * 1000,
+        }
+
+
+class InferenceServer:
+    """Micro-batches action requests from many games into single forward passes.
+
+    A batch is dispatched as soon as it holds max_batch_size requests or its
+    oldest request has waited max_latency seconds, whichever comes first.
+    """
+
+    def __init__(self, policy, max_batch_size=32, max_latency=0.005):
+        self.policy = policy
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.stats = InferenceStats()
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()  # nothing is queued behind the shutdown sentinel
+        self._shape = None  # observation shape, fixed by the first request
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="inference-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            if not self._running: return
+            self._running = False
+            self._requests.put(None)
+        self._thread.join()
+        self._thread = None
+
+        # Fail anything the server didn't get to, so no caller waits forever
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[2].set_running_or_notify_cancel():
+                item[2].set_exception(RuntimeError("InferenceServer stopped before serving this request"))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def submit(self, observation):
+        future = Future()
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("InferenceServer is not running")
+            # A batch is stacked into one array: reject mismatched observations here, not in the batch
+            if self._shape is None:
+                self._shape = np.shape(observation)
+            elif np.shape(observation) != self._shape:
+                raise ValueError(f"Observation shape {np.shape(observation)} does not match {self._shape}")
+            self._requests.put((time.perf_counter(), observation, future))
+        return future
+
+    def request_action(self, game):
+        return self.submit(observe(game))
+
+    def apply_action(self, game, future):
+        game.player.next_direction = ACTIONS[future.result()]
+
+    def act(self, game):
+        self.apply_action(game, self.request_action(game))
+
+    def _collect_batch(self, first):
+        batch = [first]
+        deadline = first[0] + self.max_latency
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0: break
+            try:
+                item = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Shutdown requested: finish this batch, then exit
+                self._requests.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _serve(self):
+        while True:
+            first = self._requests.get()
+            if first is None: break
+
+            # Callers may cancel a request while it is queued: skip those
+            batch = [item for item in self._collect_batch(first) if item[2].set_running_or_notify_cancel()]
+            if not batch: continue
+
+            dispatched = time.perf_counter()
+            try:
+                observations = np.stack([observation for _, observation, _ in batch])
+                actions = np.argmax(self.policy(observations), axis=1)
+            except Exception as error:
+                for _, _, future in batch: future.set_exception(error)
+                continue
+
+            for (_, _, future), action in zip(batch, actions):
+                future.set_result(int(action))
+            self.stats.record(len(batch), [dispatched - enqueued for enqueued, _, _ in batch])
+
+
+class PolicyController:
+    """Game controller that asks an InferenceServer for a direction at each tile center."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def update(self, game):
+        if game.player.reaches_center(game.maze):
+            self.server.act(game)
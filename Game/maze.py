@@ -1,33 +1,41 @@
-import pygame
 import numpy as np
 
+# 0: empty path, 1: wall, 2: dot, 3: power pellet
+LAYOUT = np.array([
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1],
+    [1, 3, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 3, 1],
+    [1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1],
+    [1, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1],
+    [1, 2, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1],
+    [1, 1, 1, 1, 2, 1, 1, 1, 0, 1, 0, 1, 1, 1, 2, 1, 1, 1, 1],
+    [1, 1, 1, 1, 2, 1, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 1],
+    [1, 1, 1, 1, 2, 1, 0, 1, 1, 0, 1, 1, 0, 1, 2, 1, 1, 1, 1],
+    [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 0, 1, 0, 0, 2, 0, 0, 0, 0],
+    [1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 1, 1],
+    [1, 1, 1, 1, 2, 1, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 1],
+    [1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 1, 1],
+    [1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1],
+    [1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1],
+    [1, 3, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 3, 1],
+    [1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 1],
+    [1, 2, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1],
+    [1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1],
+    [1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1],
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+])
+LAYOUT.setflags(write=False)
+
+# Walls never change during a game: a nested tuple is shared by every Maze and
+# is faster to index from Python than the numpy grid
+WALLS = tuple(tuple(bool(cell == 1) for cell in row) for row in LAYOUT)
+
+
 class Maze:
     def __init__(self):
         self.tile_size = 30
-        # 0: empty path, 1: wall, 2: dot, 3: power pellet
-        self.grid = np.array([
-            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-            [1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1],
-            [1, 3, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 3, 1],
-            [1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1],
-            [1, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1],
-            [1, 2, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1],
-            [1, 1, 1, 1, 2, 1, 1, 1, 0, 1, 0, 1, 1, 1, 2, 1, 1, 1, 1],
-            [1, 1, 1, 1, 2, 1, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 1],
-            [1, 1, 1, 1, 2, 1, 0, 1, 1, 0, 1, 1, 0, 1, 2, 1, 1, 1, 1],
-            [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 0, 1, 0, 0, 2, 0, 0, 0, 0],
-            [1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 1, 1],
-            [1, 1, 1, 1, 2, 1, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 1],
-            [1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 1, 1],
-            [1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1],
-            [1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1],
-            [1, 3, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 3, 1],
-            [1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 1],
-            [1, 2, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1],
-            [1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1],
-            [1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1],
-            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-        ])
+        self.grid = np.copy(LAYOUT)
+        self.walls = WALLS
         self.height, self.width = self.grid.shape
         self.screen_width = self.width * self.tile_size
         self.screen_height = self.height * self.tile_size
@@ -35,6 +43,10 @@ class Maze:
         self.WALL_COLOR = (0, 0, 255) # blue
         self.DOT_COLOR = (255, 255, 255) # white
         self.POWER_PELLET_COLOR = (255, 255, 0) # yellow
+        
+        # Bumped whenever the dot set changes, so planners can cache paths
+        self.dots_version = 0
+        self.last_eaten = None  # (grid_x, grid_y) of the last dot eaten, None after a reset
 
         # Sauvegarde de la grille initiale dès la création
         self.save_initial_grid()
@@ -44,6 +56,16 @@ class Maze:
         grid_y = int(y // self.tile_size)
         return (grid_x * self.tile_size + self.tile_size // 2, grid_y * self.tile_size + self.tile_size // 2)
     
+    def distance_to_center(self, x, y, dx, dy):
+        """How far (x, y) must travel along the unit direction (dx, dy) to reach a tile center.
+        
+        0 when already on one (or not moving), otherwise the center of the
+        current tile if it is still ahead, else the center of the next tile.
+        """
+        center_x, center_y = self.get_tile_center(x, y)
+        ahead = (center_x - x) * dx + (center_y - y) * dy
+        return ahead + self.tile_size if ahead < 0 else ahead
+
     def get_tile(self, x, y):
         grid_x = int(x // self.tile_size)
         grid_y = int(y // self.tile_size)
@@ -57,9 +79,39 @@ class Maze:
         grid_x = int(x // self.tile_size)
         grid_y = int(y // self.tile_size)
         
-        if 0 <= grid_x < self.width and 0 <= grid_y < self.height: return self.grid[grid_y][grid_x] == 1
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height: return self.walls[grid_y][grid_x]
         return True
 
+    def sweep(self, x, y, dx, dy):
+        """Move from (x, y) by (dx, dy) along the corridor, checking every tile crossed.
+        
+        Stops at the center of the last free tile before a wall, so large steps
+        can't jump over thin walls. Returns (x, y, blocked).
+        """
+        grid_x = int(x // self.tile_size)
+        grid_y = int(y // self.tile_size)
+        half = self.tile_size // 2
+        
+        if dx:
+            target_x = int((x + dx) // self.tile_size)
+            step = 1 if target_x > grid_x else -1
+            while grid_x != target_x:
+                if self.is_wall((grid_x + step) * self.tile_size, y):
+                    return grid_x * self.tile_size + half, y, True
+                grid_x += step
+            x += dx
+        
+        if dy:
+            target_y = int((y + dy) // self.tile_size)
+            step = 1 if target_y > grid_y else -1
+            while grid_y != target_y:
+                if self.is_wall(x, (grid_y + step) * self.tile_size):
+                    return x, grid_y * self.tile_size + half, True
+                grid_y += step
+            y += dy
+        
+        return x, y, False
+
     def eat_dot(self, x, y):
         grid_x = int(x // self.tile_size)
         grid_y = int(y // self.tile_size)
@@ -68,6 +120,8 @@ class Maze:
             if self.grid[grid_y][grid_x] in [2, 3]:
                 is_power_pellet = self.grid[grid_y][grid_x] == 3
                 self.grid[grid_y][grid_x] = 0
+                self.dots_version += 1
+                self.last_eaten = (grid_x, grid_y)
                 return True, is_power_pellet
         return False, False
     
@@ -78,6 +132,8 @@ class Maze:
     def reset(self):
         """Réinitialise la grille à son état initial."""
         self.grid = np.copy(self.initial_grid)
+        self.dots_version += 1
+        self.last_eaten = None
 
     def count_dots(self):
         """Compte le nombre de dots et power pellets restants."""
@@ -86,6 +142,8 @@ class Maze:
         return dots_count + power_pellets_count
     
     def draw(self, screen):
+        import pygame
+        
         for y in range(self.height):
             for x in range(self.width):
                 pos_x = x * self.tile_size
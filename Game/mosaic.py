@@ -0,0 +1,200 @@
+import math
+import random
+import time
+
+import numpy as np
+import pygame
+
+from game import Game
+from ghost import GhostState
+from controller import PathController
+
+
+class MosaicViewer:
+    """Shows many running games in one window as a grid of downscaled tiles.
+
+    Walls are rendered once into a shared background; each refresh only
+    overlays the remaining dots and small entity markers per game. Refreshes
+    are capped at max_fps whatever the simulation speed, and clicking a tile
+    shows that game at full resolution until the next click or Escape.
+    Finished games stay on screen for `hold` seconds before they restart,
+    and each tile keeps a tally of its wins and losses.
+    """
+
+    DOT_SPACING = 3  # dot overlay resolution, in pixels per maze cell
+
+    def __init__(self, games, columns=None, tile_width=160, max_fps=10, hold=1.0):
+        pygame.init()
+        self.games = games
+        self.maze = games[0].maze
+        self.columns = columns or math.ceil(math.sqrt(len(games)))
+        self.rows = math.ceil(len(games) / self.columns)
+        self.scale = tile_width / self.maze.screen_width
+        self.tile_size = (tile_width, round(self.maze.screen_height * self.scale))
+        self.grid_size = (self.columns * self.tile_size[0], self.rows * self.tile_size[1])
+        self.refresh_interval = 1 / max_fps
+        self.hold_refreshes = max(1, round(hold * max_fps))  # refreshes a finished game stays frozen
+
+        self.screen = pygame.display.set_mode(self.grid_size)
+        pygame.display.set_caption(f"Pac-Man x{len(games)}")
+        self.font = pygame.font.Font(None, 18)
+        self.hud_font = pygame.font.Font(None, 36)
+
+        self.background = self._render_background()
+
+        # Buffers reused for every tile's dot overlay
+        palette = np.zeros((4, 3), dtype=np.uint8)
+        palette[2] = self.maze.DOT_COLOR
+        palette[3] = self.maze.POWER_PELLET_COLOR
+        self._palette = palette
+        spacing = self.DOT_SPACING
+        self._cells = np.zeros((self.maze.width * spacing, self.maze.height * spacing, 3), dtype=np.uint8)
+        self._dots_small = pygame.Surface(self._cells.shape[:2])
+        self._dots = pygame.Surface(self.tile_size)
+        self._dots.set_colorkey((0, 0, 0))
+
+        self.focused = None  # index of the game shown at full resolution
+        self.running = True
+        self.refreshes = 0
+        self.render_time = 0.0  # seconds spent drawing, to compare against simulation time
+        self._last_refresh = 0.0
+
+        self.wins = [0] * len(games)
+        self.losses = [0] * len(games)
+        self._finished_at = [None] * len(games)  # refresh count when each game ended, while frozen
+
+    def _render_background(self):
+        # Draw the walls at full resolution once, then shrink: smooth edges for free
+        full = pygame.Surface((self.maze.screen_width, self.maze.screen_height))
+        for y, row in enumerate(self.maze.walls):
+            for x, wall in enumerate(row):
+                if wall:
+                    rect = (x * self.maze.tile_size, y * self.maze.tile_size, self.maze.tile_size, self.maze.tile_size)
+                    pygame.draw.rect(full, self.maze.WALL_COLOR, rect)
+        return pygame.transform.smoothscale(full, self.tile_size)
+
+    def tile_at(self, position):
+        column = position[0] // self.tile_size[0]
+        row = position[1] // self.tile_size[1]
+        index = row * self.columns + column
+        return index if column < self.columns and index < len(self.games) else None
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                if self.focused is None:
+                    self.running = False
+                else:
+                    self.focus(None)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.focus(self.tile_at(event.pos) if self.focused is None else None)
+
+    def focus(self, index):
+        self.focused = index
+        if index is None:
+            self.screen = pygame.display.set_mode(self.grid_size)
+        else:
+            self.screen = pygame.display.set_mode((self.maze.screen_width, self.maze.screen_height))
+
+    def ready_to_restart(self, index):
+        """Record a finished game's result; True once it has been shown for hold_refreshes refreshes."""
+        if self._finished_at[index] is None:
+            self._finished_at[index] = self.refreshes
+            if self.games[index].win:
+                self.wins[index] += 1
+            else:
+                self.losses[index] += 1
+        if self.refreshes - self._finished_at[index] < self.hold_refreshes:
+            return False
+        self._finished_at[index] = None
+        return True
+
+    def update(self):
+        """Call once per simulation step; redraws only when a refresh is due."""
+        now = time.perf_counter()
+        if now - self._last_refresh < self.refresh_interval:
+            return self.running
+        self._last_refresh = now
+
+        self.handle_events()
+        if not self.running: return False
+
+        if self.focused is None:
+            for index, game in enumerate(self.games):
+                self.draw_tile(index, game)
+        else:
+            self.draw_focused(self.games[self.focused])
+        pygame.display.flip()
+
+        self.refreshes += 1
+        self.render_time += time.perf_counter() - now
+        return True
+
+    def draw_tile(self, index, game):
+        left = (index % self.columns) * self.tile_size[0]
+        top = (index // self.columns) * self.tile_size[1]
+        self.screen.blit(self.background, (left, top))
+
+        # Remaining dots: one pixel per cell center, scaled to the tile in C
+        spacing = self.DOT_SPACING
+        self._cells[spacing // 2::spacing, spacing // 2::spacing] = self._palette[game.maze.grid.T]
+        pygame.surfarray.blit_array(self._dots_small, self._cells)
+        pygame.transform.scale(self._dots_small, self.tile_size, self._dots)
+        self.screen.blit(self._dots, (left, top))
+
+        radius = max(2, round(game.player.radius * self.scale))
+        for ghost in game.ghosts:
+            color = ghost.color
+            if ghost.state == GhostState.FRIGHTENED: color = ghost.frightened_color
+            elif ghost.state == GhostState.EATEN: color = ghost.eaten_color
+            self._draw_marker(color, ghost.position, left, top, radius)
+        self._draw_marker(game.player.color, game.player.position, left, top, radius)
+
+        score = self.font.render(str(game.player.score), True, (255, 255, 255))
+        self.screen.blit(score, (left + 3, top + 2))
+        tally = self.font.render(f"W{self.wins[index]} L{self.losses[index]}", True, (255, 255, 255))
+        self.screen.blit(tally, (left + 3, top + self.tile_size[1] - tally.get_height() - 2))
+        if game.game_over:
+            border = (0, 255, 0) if game.win else (255, 0, 0)
+            pygame.draw.rect(self.screen, border, (left, top, *self.tile_size), width=2)
+
+    def _draw_marker(self, color, position, left, top, radius):
+        center = (left + int(position.x * self.scale), top + int(position.y * self.scale))
+        pygame.draw.circle(self.screen, color, center, radius)
+
+    def draw_focused(self, game):
+        game.render(self.screen)
+        text = self.hud_font.render(f"Game {self.focused}  Score: {game.player.score}  Level: {game.level}  "
+                                    f"W{self.wins[self.focused]} L{self.losses[self.focused]}",
+                                    True, (255, 255, 255))
+        self.screen.blit(text, (10, 10))
+
+    def close(self):
+        pygame.quit()
+
+
+def run_mosaic(count, max_fps=10, seed=None, hold=1.0):
+    """Simulate `count` bot-controlled games as fast as possible and watch them in a mosaic."""
+    if seed is not None: random.seed(seed)
+    games = []
+    for _ in range(count):
+        game = Game(headless=True)
+        game.controller = PathController()
+        games.append(game)
+
+    viewer = MosaicViewer(games, max_fps=max_fps, hold=hold)
+    start = time.perf_counter()
+    while viewer.running:
+        for index, game in enumerate(games):
+            if game.game_over:
+                # Frozen on its final frame until the viewer has shown the result
+                if not viewer.ready_to_restart(index): continue
+                game.reset_game()
+            game.update()
+        viewer.update()
+
+    elapsed = time.perf_counter() - start
+    viewer.close()
+    return viewer.render_time / elapsed if elapsed else 0.0
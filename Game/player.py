@@ -1,12 +1,40 @@
-import pygame
-from pygame.math import Vector2
 import math
 
+from entities import EntityPool, PoolField, PoolVector
+from scheduler import TickScheduler
+from vector import Vector2
+
+# Shared direction constants, never mutated
+LEFT, RIGHT, UP, DOWN = Vector2(-1, 0), Vector2(1, 0), Vector2(0, -1), Vector2(0, 1)
+
 class Player:
-    def __init__(self, x, y):
-        self.position = Vector2(x, y)
-        self.direction = Vector2(0, 0)
-        self.next_direction = Vector2(0, 0)
+    __slots__ = ("_pool", "_slot", "scheduler", "radius", "color", "eye_color",
+                 "min_mouth_angle", "max_mouth_angle", "mouth_angle",
+                 "animation_timer", "animation_speed", "base_animation_speed",
+                 "eating_animation_duration", "_animation_event",
+                 "is_dying", "_death_start", "death_animation_duration",
+                 "score", "powered_up", "_power_start", "_power_event",
+                 "power_duration", "power_flash_threshold",
+                 "turn_cooldown_duration", "_turn_ready_tick",
+                 "ghosts")
+
+    # Hot state lives in the EntityPool, these are views on the player's slot
+    position = PoolVector()
+    direction = PoolVector()
+    next_direction = PoolVector()
+    last_position = PoolVector()
+    speed = PoolField()
+
+    def __init__(self, x, y, pool=None, scheduler=None):
+        self._pool = pool if pool is not None else EntityPool(1)
+        self._slot = self._pool.allocate()
+        # Owner advances the scheduler once per tick (Game does it in update)
+        self.scheduler = scheduler if scheduler is not None else TickScheduler()
+
+        self.position = (x, y)
+        self.direction = (0, 0)
+        self.next_direction = (0, 0)
+        self.last_position = (x, y)
         self.speed = 2
         self.radius = 13
         self.color = (255, 255, 0)  # bright yellow
@@ -18,72 +46,102 @@ class Player:
         self.mouth_angle = self.max_mouth_angle
         self.animation_timer = 0
         self.animation_speed = 0.5
+        self.base_animation_speed = 0.5
+        self.eating_animation_duration = 12  # ticks, ~250ms at 50fps
+        self._animation_event = None
         
         # Death animation
         self.is_dying = False
-        self.death_timer = 0
-        self.death_animation_duration = 1.5  # seconds
+        self._death_start = 0
+        self.death_animation_duration = 75  # ticks, ~1.5 seconds at 50fps
         
-        # Score and power state
+        # Score and power state, durations in ticks
         self.score = 0
         self.powered_up = False
-        self.power_timer = 0
-        self.power_duration = 10  # seconds
-        self.power_flash_threshold = 3  # seconds remaining when blinking starts
+        self._power_start = 0
+        self._power_event = None
+        self.power_duration = 500  # same as the ghosts' frightened duration
+        self.power_flash_threshold = 150  # ticks remaining when blinking starts
         
         # For smoother turning
-        self.turning_cooldown = 0
+        self.turn_cooldown_duration = 6  # ticks
+        self._turn_ready_tick = 0
+        
+        self.ghosts = []
+    
+    @property
+    def turning_cooldown(self):
+        """Ticks left before the player may turn again."""
+        return max(0, self._turn_ready_tick - self.scheduler.tick)
+    
+    @property
+    def power_timer(self):
+        """Ticks since the last power pellet."""
+        return self.scheduler.tick - self._power_start
+    
+    @property
+    def death_timer(self):
+        """Ticks since the death animation started."""
+        return self.scheduler.tick - self._death_start if self.is_dying else 0
 
     def can_move_in_direction(self, direction, maze):
-        next_tile_pos = self.position + direction * maze.tile_size
-        return not maze.is_wall(next_tile_pos.x, next_tile_pos.y)
+        position = self.position
+        return not maze.is_wall(position.x + direction.x * maze.tile_size,
+                                position.y + direction.y * maze.tile_size)
     
-    def is_at_center(self, maze):
-        center_x, center_y = maze.get_tile_center(self.position.x, self.position.y)
-        return (abs(self.position.x - center_x) < self.speed and abs(self.position.y - center_y) < self.speed)
+    def reaches_center(self, maze):
+        """Whether this frame's move reaches a tile center, where the player can turn."""
+        position, direction = self.position, self.direction
+        ahead = maze.distance_to_center(position.x, position.y, direction.x, direction.y)
+        return ahead < self.speed or ahead == 0
 
     def handle_input(self, event):
+        import pygame
+        
         if event.type == pygame.KEYDOWN and not self.is_dying:
             if event.key in [pygame.K_LEFT, pygame.K_q]: 
-                self.next_direction = Vector2(-1, 0)
+                self.next_direction = LEFT
             elif event.key in [pygame.K_RIGHT, pygame.K_d]: 
-                self.next_direction = Vector2(1, 0)
+                self.next_direction = RIGHT
             elif event.key in [pygame.K_UP, pygame.K_z]: 
-                self.next_direction = Vector2(0, -1)
+                self.next_direction = UP
             elif event.key in [pygame.K_DOWN, pygame.K_s]: 
-                self.next_direction = Vector2(0, 1)
+                self.next_direction = DOWN
 
-    def update(self, maze, dt=1/60):
+    def update(self, maze):
         if self.is_dying:
-            self.update_death_animation(dt)
             return False
+        
+        self.last_position = self.position
+        position, direction = self.position, self.direction
+        power = False
+        
+        # Turns only happen at tile centers: stop at each one this move crosses,
+        # so a step longer than half a tile can't skip a turn or a dot
+        remaining = self.speed
+        ahead = maze.distance_to_center(position.x, position.y, direction.x, direction.y)
+        while ahead < remaining or ahead == 0:
+            position.update(position.x + direction.x * ahead, position.y + direction.y * ahead)
+            remaining -= ahead
+            power = self._eat(maze) or power
             
-        if self.powered_up:
-            self.update_power_state(dt)
+            if self.next_direction and self.scheduler.tick >= self._turn_ready_tick:
+                if self.can_move_in_direction(self.next_direction, maze):
+                    self.direction = self.next_direction
+                    self.next_direction.update(0, 0)
+                    self._turn_ready_tick = self.scheduler.tick + self.turn_cooldown_duration  # prevent rapid turning
             
-        if self.turning_cooldown > 0:
-            self.turning_cooldown -= dt
-        
-        if self.next_direction and self.is_at_center(maze) and self.turning_cooldown <= 0:
-            if self.can_move_in_direction(self.next_direction, maze):
-                self.direction = self.next_direction
-                # snap to grid when turning
-                center_x, center_y = maze.get_tile_center(self.position.x, self.position.y)
-                self.position.x = center_x
-                self.position.y = center_y
-                self.next_direction = Vector2(0, 0)
-                self.turning_cooldown = 0.1  # prevent rapid turning
-        
-        if self.direction:
-            if not self.can_move_in_direction(self.direction, maze) and self.is_at_center(maze):
+            if not direction or not self.can_move_in_direction(direction, maze):
                 # stop at center if we can't move forward
-                center_x, center_y = maze.get_tile_center(self.position.x, self.position.y)
-                self.position.x = center_x
-                self.position.y = center_y
-            else:
-                new_pos = self.position + self.direction * self.speed
-                if not maze.is_wall(new_pos.x, new_pos.y): 
-                    self.position = new_pos
+                remaining = 0
+                break
+            ahead = maze.tile_size
+        
+        if remaining:
+            new_x, new_y, _ = maze.sweep(position.x, position.y,
+                                         direction.x * remaining, direction.y * remaining)
+            position.update(new_x, new_y)
+            power = self._eat(maze) or power
         
         # Update mouth animation - smoother sine wave animation
         self.animation_timer += self.animation_speed
@@ -94,32 +152,39 @@ class Player:
         self.mouth_angle = self.min_mouth_angle + (self.max_mouth_angle - self.min_mouth_angle) * (
             (math.sin(self.animation_timer) + 1) / 2)  # Normalized to 0-1 range
             
-        # Check if pacman ate anything
+        return power
+    
+    def _eat(self, maze):
+        # Check if pacman ate anything on the tile he is on
         eaten, power = maze.eat_dot(self.position.x, self.position.y)
         if eaten: 
             self.score += 10 if not power else 50
             # Speed up mouth animation briefly when eating
             self.animation_speed = 0.5
-            pygame.time.set_timer(pygame.USEREVENT + 1, 250)  # Reset animation speed after delay
+            # Reset animation speed after delay
+            self.scheduler.cancel(self._animation_event)
+            self._animation_event = self.scheduler.schedule(self.eating_animation_duration, self._reset_animation_speed)
             
         if power:
             self.powered_up = True
-            self.power_timer = 0
+            self._power_start = self.scheduler.tick
+            self.scheduler.cancel(self._power_event)
+            self._power_event = self.scheduler.schedule(self.power_duration, self._end_power)
             
         return power
     
-    def update_power_state(self, dt):
-        self.power_timer += dt
-        if self.power_timer >= self.power_duration:
-            self.powered_up = False
+    def _reset_animation_speed(self):
+        self.animation_speed = self.base_animation_speed
+    
+    def _end_power(self):
+        self.powered_up = False
             
-    def update_death_animation(self, dt):
-        self.death_timer += dt
+    def update_death_animation(self):
         return self.death_timer >= self.death_animation_duration
         
     def trigger_death_animation(self):
         self.is_dying = True
-        self.death_timer = 0
+        self._death_start = self.scheduler.tick
         
     def draw(self, screen):
         if self.is_dying:
@@ -128,6 +193,8 @@ class Player:
             self.draw_normal(screen)
             
     def draw_normal(self, screen):
+        import pygame
+        
         # Calculate rotation based on direction
         rotation = 0
         if self.direction.x < 0: rotation = 180
@@ -155,6 +222,8 @@ class Player:
             pygame.draw.polygon(screen, (0, 0, 0), mouth_points)
             
     def draw_death_animation(self, screen):
+        import pygame
+        
         # Death animation - pacman gradually disappears with a 360 degree mouth opening
         progress = self.death_timer / self.death_animation_duration
         
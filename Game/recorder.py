@@ -0,0 +1,120 @@
+import os
+import queue
+import threading
+
+import numpy as np
+import pygame
+
+
+class FrameRecorder:
+    """Captures rendered frames and encodes them on a background thread."""
+
+    FORMATS = ("png", "npz")
+
+    def __init__(self, output_dir, fmt="png", queue_size=32, clip_length=32, capture_every=1):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown capture format: {fmt!r} (expected one of {self.FORMATS})")
+        for name, value in (("queue_size", queue_size), ("clip_length", clip_length), ("capture_every", capture_every)):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.queue_size = queue_size
+        self.clip_length = clip_length  # frames per .npz clip
+        self.capture_every = capture_every  # record one frame out of N
+
+        # Stats
+        self.frame_count = 0  # frames offered to the recorder
+        self.captured = 0     # frames copied into the queue
+        self.dropped = 0      # frames skipped because the encoder fell behind
+        self.encoded = 0      # frames written to disk
+
+        self._frames = queue.Queue()
+        self._free = queue.Queue()  # preallocated buffers ready to be filled
+        self._shape = None
+        self._clip = None  # preallocated (clip_length, width, height, 3) array for npz clips
+        self._clip_size = 0
+        self._clip_index = 0
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._running = True
+        self._thread = threading.Thread(target=self._encode_loop, name="frame-recorder", daemon=True)
+        self._thread.start()
+
+    def _allocate_buffers(self, shape):
+        # One buffer per queue slot, allocated once on the first frame
+        self._shape = shape
+        for _ in range(self.queue_size):
+            self._free.put(np.empty(shape, dtype=np.uint8))
+        if self.fmt == "npz":
+            self._clip = np.empty((self.clip_length,) + shape, dtype=np.uint8)
+
+    def capture(self, surface):
+        if not self._running: return
+
+        index = self.frame_count
+        self.frame_count += 1
+        if index % self.capture_every: return
+
+        # pixels3d locks the surface and exposes its memory without copying
+        view = pygame.surfarray.pixels3d(surface)
+        if self._shape is None:
+            self._allocate_buffers(view.shape)
+
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            # Encoder is behind: skip this frame rather than stall the simulation
+            del view
+            self.dropped += 1
+            return
+
+        np.copyto(buffer, view)
+        del view  # release the surface lock before the next draw
+        self._frames.put((index, buffer))
+        self.captured += 1
+
+    def _encode_loop(self):
+        while True:
+            item = self._frames.get()
+            if item is None: break
+
+            index, buffer = item
+            if self.fmt == "png":
+                self._write_png(index, buffer)
+            else:
+                np.copyto(self._clip[self._clip_size], buffer)
+                self._clip_size += 1
+            # The buffer is free again before the clip is compressed
+            self._free.put(buffer)
+            self.encoded += 1
+            if self._clip_size >= self.clip_length:
+                self._flush_clip()
+
+        if self._clip_size:
+            self._flush_clip()
+
+    def _write_png(self, index, buffer):
+        frame = pygame.surfarray.make_surface(buffer)
+        pygame.image.save(frame, os.path.join(self.output_dir, f"frame_{index:06d}.png"))
+
+    def _flush_clip(self):
+        # surfarray is (width, height, 3); store clips as (frames, height, width, 3).
+        # The transposed view is written out in chunks, without a full copy
+        frames = self._clip[:self._clip_size].transpose(0, 2, 1, 3)
+        path = os.path.join(self.output_dir, f"clip_{self._clip_index:04d}.npz")
+        np.savez_compressed(path, frames=frames)
+        self._clip_size = 0
+        self._clip_index += 1
+
+    def stop(self):
+        if not self._running: return
+        self._running = False
+        # Drain everything already queued before the thread exits
+        self._frames.put(None)
+        self._thread.join()
+        self._thread = None
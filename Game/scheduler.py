@@ -0,0 +1,63 @@
+class Timer:
+    __slots__ = ("due", "callback", "args", "active")
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True  # False once fired or cancelled
+
+
+class TickScheduler:
+    """Timer wheel driving every timed game event, counted in simulation ticks.
+
+    Timers are bucketed by due tick modulo the wheel size, so scheduling and
+    cancelling are O(1) and a tick with nothing due costs one list lookup.
+    Ticks are frames: the same schedule plays out identically with or
+    without a display.
+    """
+
+    def __init__(self, wheel_size=256):
+        self.tick = 0
+        self._wheel = [[] for _ in range(wheel_size)]
+        self._pending = 0
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) `delay` ticks from now (at least one)."""
+        timer = Timer(self.tick + max(1, int(delay)), callback, args)
+        self._wheel[timer.due % len(self._wheel)].append(timer)
+        self._pending += 1
+        return timer
+
+    def cancel(self, timer):
+        if timer is not None and timer.active:
+            timer.active = False
+            self._pending -= 1
+            # Left in its bucket and dropped when the wheel reaches it
+
+    def remaining(self, timer):
+        """Ticks left before the timer fires, 0 if it already fired or was cancelled."""
+        if timer is None or not timer.active: return 0
+        return timer.due - self.tick
+
+    def advance(self, ticks=1):
+        target = self.tick + ticks
+        while self.tick < target:
+            if not self._pending:
+                # Nothing scheduled: jump straight to the target
+                self.tick = target
+                return
+
+            self.tick += 1
+            bucket = self._wheel[self.tick % len(self._wheel)]
+            if not bucket: continue
+
+            due = [timer for timer in bucket if timer.due == self.tick]
+            if not due: continue
+            bucket[:] = [timer for timer in bucket if timer.due != self.tick and timer.active]
+
+            for timer in due:
+                if not timer.active: continue
+                timer.active = False
+                self._pending -= 1
+                timer.callback(*timer.args)
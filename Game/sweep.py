@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+from collections import defaultdict
+from concurrent.futures import as_completed
+
+from ghost import Ghost
+from workers import CONTROLLERS, WorkerPool, run_episode
+
+
+def config_hash(config, max_steps):
+    # max_steps changes outcomes, so it is part of what a cached result was computed for
+    payload = json.dumps({"params": config, "max_steps": max_steps}, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def grid_search(space):
+    """Every combination of a {parameter: [values]} space."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_search(space, samples, seed=0):
+    """`samples` configurations drawn from {parameter: [choices] or {"low": a, "high": b}}."""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(samples):
+        config = {}
+        for name in sorted(space):
+            values = space[name]
+            if isinstance(values, dict):
+                low, high = values["low"], values["high"]
+                if isinstance(low, int) and isinstance(high, int):
+                    config[name] = rng.randint(low, high)
+                else:
+                    config[name] = rng.uniform(low, high)
+            else:
+                config[name] = rng.choice(values)
+        configs.append(config)
+    return configs
+
+
+class ResultCache:
+    """One JSON file per (config hash, controller, seed) under `directory`.
+
+    Files are written atomically as each game finishes, so an interrupted
+    sweep keeps everything it completed and a rerun only plays what's missing.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, key, controller, seed):
+        return os.path.join(self.directory, key, controller, f"{seed}.json")
+
+    def get(self, key, controller, seed):
+        try:
+            with open(self.path(key, controller, seed)) as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, controller, seed, result):
+        path = self.path(key, controller, seed)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(result, file)
+        os.replace(temporary, path)
+
+
+def run_sweep(configs, seeds, controller="path", workers=None, cache_dir=".sweep_cache", max_steps=10000,
+              verbose=False):
+    """Play every configuration on every seed, reusing cached results; returns all results.
+
+    With verbose, progress is printed as games finish.
+    """
+    cache = ResultCache(cache_dir)
+    results, pending = [], []
+    for config in configs:
+        for name in config:
+            if name not in Ghost.TUNABLE:
+                raise ValueError(f"Unknown ghost parameter: {name!r} (expected one of {Ghost.TUNABLE})")
+        key = config_hash(config, max_steps)
+        for seed in seeds:
+            cached = cache.get(key, controller, seed)
+            if cached is None:
+                pending.append((config, key, seed))
+            else:
+                results.append(cached)
+
+    if verbose: print(f"{len(results)} cached, {len(pending)} to simulate")
+    if pending:
+        with WorkerPool(workers) as pool:
+            futures = {
+                pool.submit(run_episode, seed, controller, max_steps, config): (config, key, seed)
+                for config, key, seed in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                config, key, seed = futures[future]
+                result = dict(future.result(), config=config, max_steps=max_steps)
+                cache.put(key, controller, seed, result)
+                results.append(result)
+                if verbose and done % 100 == 0: print(f"{done}/{len(pending)} games")
+    return results
+
+
+def summarize(results):
+    """Win rate and mean score per configuration, best first."""
+    groups = defaultdict(list)
+    for result in results:
+        groups[json.dumps(result["config"], sort_keys=True)].append(result)
+
+    rows = []
+    for config, group in groups.items():
+        rows.append({
+            "config": json.loads(config),
+            "games": len(group),
+            "win_rate": sum(result["win"] for result in group) / len(group),
+            "mean_score": sum(result["score"] for result in group) / len(group),
+        })
+    rows.sort(key=lambda row: (row["win_rate"], row["mean_score"]), reverse=True)
+    return rows
+
+
+def surfaces(results, bins=5):
+    """Marginal win rate and mean score for each value of each swept parameter.
+
+    Parameters with more than `bins` distinct values (random search) are
+    grouped into equal-width bins, labelled by the bin's lower edge.
+    """
+    values = defaultdict(set)
+    for result in results:
+        for name, value in result["config"].items():
+            values[name].add(value)
+
+    table = {}
+    for name, seen in values.items():
+        low, high = min(seen), max(seen)
+        binned = len(seen) > bins and high > low
+        groups = defaultdict(list)
+        for result in results:
+            if name not in result["config"]: continue
+            value = result["config"][name]
+            if binned:
+                index = min(int((value - low) / (high - low) * bins), bins - 1)
+                value = round(low + index * (high - low) / bins, 3)
+            groups[value].append(result)
+        table[name] = {
+            value: {
+                "games": len(group),
+                "win_rate": sum(result["win"] for result in group) / len(group),
+                "mean_score": sum(result["score"] for result in group) / len(group),
+            }
+            for value, group in sorted(groups.items())
+        }
+    return table
+
+
+def print_report(results, top=10):
+    rows = summarize(results)
+    print(f"\nTop {min(top, len(rows))} of {len(rows)} configurations")
+    print(f"{'win rate':>8}  {'score':>8}  {'games':>5}  config")
+    for row in rows[:top]:
+        print(f"{row['win_rate']:>8.1%}  {row['mean_score']:>8.1f}  {row['games']:>5}  {json.dumps(row['config'], sort_keys=True)}")
+
+    for name, by_value in surfaces(results).items():
+        print(f"\n{name}")
+        print(f"{'value':>10}  {'win rate':>8}  {'score':>8}  {'games':>5}")
+        for value, stats in by_value.items():
+            print(f"{value:>10}  {stats['win_rate']:>8.1%}  {stats['mean_score']:>8.1f}  {stats['games']:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep ghost behaviour parameters over many headless games.")
+    parser.add_argument("space", help="JSON search space (inline or a file path): {parameter: [values]} "
+                                      "or, with --random, {parameter: {\"low\": a, \"high\": b}}")
+    parser.add_argument("--random", type=int, metavar="N", help="sample N configurations instead of the full grid")
+    parser.add_argument("--seeds", type=int, default=20, help="games per configuration")
+    parser.add_argument("--controller", choices=sorted(CONTROLLERS), default="path")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-steps", type=int, default=10000)
+    parser.add_argument("--cache", default=".sweep_cache", help="result cache directory")
+    args = parser.parse_args()
+
+    if os.path.exists(args.space):
+        with open(args.space) as file:
+            space = json.load(file)
+    else:
+        space = json.loads(args.space)
+
+    configs = random_search(space, args.random) if args.random else grid_search(space)
+    results = run_sweep(configs, range(args.seeds), args.controller, args.workers, args.cache, args.max_steps,
+                        verbose=True)
+    print_report(results)
+
+
+if __name__ == "__main__": main()
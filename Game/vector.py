@@ -0,0 +1,123 @@
+import math
+import numbers
+
+
+class Vector2:
+    """Minimal 2D vector with the pygame.math.Vector2 API used by the simulation.
+
+    Keeps ghost, player and maze logic importable without pygame; pygame's
+    drawing functions accept it anywhere they accept a point.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=0, y=None):
+        if y is None:
+            if isinstance(x, numbers.Real):
+                y = x
+            else:
+                x, y = x
+        self.x = x
+        self.y = y
+
+    def update(self, x=0, y=None):
+        if y is None:
+            if x.__class__ is Vector2:
+                x, y = x.x, x.y
+            elif isinstance(x, numbers.Real):
+                y = x
+            else:
+                x, y = x
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"[{self.x}, {self.y}]"
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return (self.x, self.y)[index]
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __eq__(self, other):
+        if other.__class__ is Vector2:
+            return self.x == other.x and self.y == other.y
+        try:
+            other_x, other_y = other
+        except (TypeError, ValueError):
+            return NotImplemented
+        return self.x == other_x and self.y == other_y
+
+    __hash__ = None  # mutable, like pygame's Vector2
+
+    def __bool__(self):
+        return self.x != 0 or self.y != 0
+
+    def __neg__(self):
+        return Vector2(-self.x, -self.y)
+
+    def __add__(self, other):
+        other_x, other_y = other
+        return Vector2(self.x + other_x, self.y + other_y)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other_x, other_y = other
+        return Vector2(self.x - other_x, self.y - other_y)
+
+    def __rsub__(self, other):
+        other_x, other_y = other
+        return Vector2(other_x - self.x, other_y - self.y)
+
+    def __mul__(self, scalar):
+        return Vector2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __iadd__(self, other):
+        other_x, other_y = other
+        self.x += other_x
+        self.y += other_y
+        return self
+
+    def __isub__(self, other):
+        other_x, other_y = other
+        self.x -= other_x
+        self.y -= other_y
+        return self
+
+    def __imul__(self, scalar):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def length(self):
+        return math.hypot(self.x, self.y)
+
+    def length_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    def distance_to(self, other):
+        if other.__class__ is Vector2:
+            return math.hypot(self.x - other.x, self.y - other.y)
+        other_x, other_y = other
+        return math.hypot(self.x - other_x, self.y - other_y)
+
+    def normalize(self):
+        length = self.length()
+        if length == 0:
+            raise ValueError("Can't normalize Vector of length Zero")
+        return Vector2(self.x / length, self.y / length)
+
+    def rotate(self, angle):
+        radians = math.radians(angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+        return Vector2(self.x * cos - self.y * sin, self.x * sin + self.y * cos)
@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from game import Game
+from controller import PathController
+
+# Modules imported once by the fork server; every worker is forked from it with
+# numpy, the maze tables and the simulation code already loaded
+PRELOAD = ["numpy", "vector", "entities", "maze", "ghost", "player", "game", "controller", "workers"]
+
+# Controllers are chosen by name so jobs stay cheap to pickle
+CONTROLLERS = {
+    "none": lambda: None,
+    "path": PathController,
+}
+
+
+def run_episode(seed, controller="path", max_steps=10000, ghost_params=None):
+    """Play one headless game and return its outcome."""
+    random.seed(seed)
+    game = Game(headless=True, ghost_params=ghost_params)
+    game.controller = CONTROLLERS[controller]()
+    steps = game.simulate(max_steps)
+    return {
+        "seed": seed,
+        "controller": controller,
+        "score": game.player.score,
+        "win": game.win,
+        "steps": steps,
+    }
+
+
+def _warm_worker():
+    # Touch everything a job needs so the first real job runs at full speed
+    Game(headless=True).update()
+
+
+def _ready():
+    return os.getpid()
+
+
+def _context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(PRELOAD)
+        return context
+    # No fork server on this platform (Windows): each worker pays a full interpreter start
+    return multiprocessing.get_context("spawn")
+
+
+class WorkerPool:
+    """Process pool whose workers are forked from a prewarmed fork server.
+
+    All workers are started when the pool is created, so the first jobs
+    don't pay for interpreter and import startup.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=_context(), initializer=_warm_worker
+        )
+        self.prewarm()
+
+    def prewarm(self):
+        # Each pending submit spawns a worker until the pool is full
+        futures = [self.executor.submit(_ready) for _ in range(self.workers)]
+        return {future.result() for future in futures}
+
+    def submit(self, fn, *args, **kwargs):
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def map(self, fn, *iterables, chunksize=1):
+        return self.executor.map(fn, *iterables, chunksize=chunksize)
+
+    def run_episodes(self, seeds, controller="path", max_steps=10000):
+        futures = [self.submit(run_episode, seed, controller, max_steps) for seed in seeds]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()